@@ -6,6 +6,7 @@ This module handles database connection setup and configuration.
 
 import os
 import logging
+from contextvars import ContextVar
 from typing import Optional
 from pathlib import Path
 
@@ -46,8 +47,10 @@ if DB_TYPE == "sqlite":
         echo=os.getenv("DEBUG", "false").lower() == "true"
     )
 else:
-    # Create PostgreSQL database URL
-    SQLALCHEMY_DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    # Create PostgreSQL database URL (explicit driver, matching requirements.txt)
+    SQLALCHEMY_DATABASE_URL = (
+        f"postgresql+psycopg2://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    )
     
     # Create engine with PostgreSQL-specific configuration
     engine = create_engine(
@@ -58,15 +61,27 @@ else:
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Session bound to the current context, used instead of a new one when set
+db_session_context: ContextVar[Optional[Session]] = ContextVar("db_session_context", default=None)
+
 def get_db() -> Session:
     """
     Get a database session.
     
     This function should be used as a dependency in FastAPI route functions.
+    If a session has been bound to the current context through
+    ``db_session_context``, that session is returned and left open for its
+    owner to close. This lets tests supply their own session without
+    mutating ``app.dependency_overrides``.
     
     Returns:
         Session: A SQLAlchemy session.
     """
+    session = db_session_context.get()
+    if session is not None:
+        yield session
+        return
+
     db = SessionLocal()
     try:
         yield db
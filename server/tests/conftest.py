@@ -0,0 +1,18 @@
+"""
+Shared pytest fixtures for the NFC server tests.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from server.api.app import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Provide a single TestClient for the whole test session.
+
+    The client is entered once so application startup and shutdown
+    handlers run a single time instead of once per test.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
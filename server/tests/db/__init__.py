@@ -0,0 +1 @@
+"""Database test package for NFC server."""
@@ -0,0 +1,82 @@
+"""
+Database configuration tests for the NFC server.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from server.db import config
+from server.db.config import SessionLocal, db_session_context, get_db
+
+
+@pytest.fixture(scope="module")
+def session_probe_client():
+    """Provide a client for a local app whose routes report their session."""
+    probe_app = FastAPI()
+
+    @probe_app.get("/async")
+    async def async_probe(db: Session = Depends(get_db)):
+        return {"session_id": id(db)}
+
+    @probe_app.get("/sync")
+    def sync_probe(db: Session = Depends(get_db)):
+        return {"session_id": id(db)}
+
+    with TestClient(probe_app) as probe_client:
+        yield probe_client
+
+
+def test_get_db_creates_and_closes_session_by_default(monkeypatch):
+    """Test get_db opens a new session when none is bound and closes it after use."""
+    session = MagicMock(spec=Session)
+    session_factory = MagicMock(return_value=session)
+    monkeypatch.setattr(config, "SessionLocal", session_factory)
+
+    gen = get_db()
+    assert next(gen) is session
+    session_factory.assert_called_once_with()
+    session.close.assert_not_called()
+
+    gen.close()
+    session.close.assert_called_once_with()
+
+
+def test_get_db_uses_context_session(monkeypatch):
+    """Test get_db yields the session bound to the current context."""
+    session_factory = MagicMock()
+    monkeypatch.setattr(config, "SessionLocal", session_factory)
+
+    session = SessionLocal()
+    token = db_session_context.set(session)
+    try:
+        gen = get_db()
+        assert next(gen) is session
+        gen.close()
+
+        # No new session is created and the bound one is left open for its owner
+        session_factory.assert_not_called()
+        assert session.execute(text("SELECT 1")).scalar() == 1
+    finally:
+        db_session_context.reset(token)
+        session.close()
+
+    assert db_session_context.get() is None
+
+
+@pytest.mark.parametrize("path", ["/async", "/sync"])
+def test_route_receives_context_session(session_probe_client, path):
+    """Test a Depends(get_db) route receives the context-bound session."""
+    session = SessionLocal()
+    token = db_session_context.set(session)
+    try:
+        response = session_probe_client.get(path)
+    finally:
+        db_session_context.reset(token)
+        session.close()
+
+    assert response.status_code == 200
+    assert response.json() == {"session_id": id(session)}